@@ -1,165 +1,361 @@
-from functools   import lru_cache
+from collections import OrderedDict
 from fastapi     import FastAPI, HTTPException
-from bs4         import BeautifulSoup
-import requests, re
+from html        import unescape
+from selectolax.lexbor import LexborHTMLParser
+import aiohttp, asyncio, re, time
+import logging
 import uvicorn
 import os
 
 HEADERS = {
     "User-Agent":
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-    "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
+    "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
+    "Accept-Encoding": "gzip, br",      # -- br needs the Brotli package; aiohttp inflates both
 }
 
-@lru_cache(maxsize=256)                # -- 60-second cache avoids hammering Google
-def scrape_google_finance(symbol: str) -> dict:
-    """Return price, abs change, % change and market-cap scraped from Google Finance."""
+_log_level = logging.getLevelName(os.environ.get("LOG_LEVEL", "WARNING").upper())
+logging.basicConfig(level=_log_level if isinstance(_log_level, int) else logging.WARNING)   # -- typo falls back to WARNING
+logger = logging.getLogger(__name__)
+
+# Fallback selectors, tried in order, as (selector, allowed tags). Each is the minimal covering
+# form (".YMlKec" already matches "div.YMlKec", "main div.YMlKec.fxKbKc", ...). Where a former
+# div/span pair was collapsed into one selector the tag restriction is kept; None means any tag.
+_DIV_SPAN = ("div", "span")
+
+_PRICE_SELECTORS = (
+    (".YMlKec",           None),       # Price display class; main quote ranked first, see _price_rank
+    ("[data-last-price]", _DIV_SPAN),
+    ("[data-price]",      None),
+    ("[data-value]",      _DIV_SPAN),
+    (".price",            None),
+    ("[class*='price']",  _DIV_SPAN),
+    ("[class*='value']",  _DIV_SPAN),
+    ("[class*='last']",   _DIV_SPAN),
+    ("[class*='quote']",  _DIV_SPAN),
+)
+
+# Change selectors - updated with current Google Finance classes
+_CHANGE_SELECTORS = (
+    ("div.JwB6zf",        None),       # Current class for change display
+    ("span.NydbP",        None),       # Container for change information
+    ("[data-change]",     None),
+    (".change",           None),
+    ("[class*='change']", _DIV_SPAN),
+    ("[class*='diff']",   _DIV_SPAN),
+)
+
+# Market cap selectors - updated patterns
+_MCAP_SELECTORS = (
+    ("[class*='P6K39c']",  _DIV_SPAN), # Current value display class
+    ("div.KFglDc",         None),      # Legacy class
+    ("[data-market-cap]",  None),
+    (".market-cap",        None),
+    ("[class*='cap']",     _DIV_SPAN),
+)
+
+_CHANGE_RE = re.compile(r"([+\-]?[0-9.,]+)\s*\(([+\-]?[0-9.,%]+)\)")   # -- "+1.50 (+0.74%)"
+_NUM_RE    = re.compile(r'\$?\d+\.?\d*')
+_SYMBOL_RE = re.compile(r'^(?=.*[A-Z0-9])[A-Z0-9.:-]{1,20}$')   # -- e.g. AAPL, BRK.B, .DJI:INDEXDJX; not ".."
+_PRICE_TEXT_RE = re.compile(r'^\s*\$?([0-9]+(?:,[0-9]{3})*(?:\.[0-9]+)?)\s*$')   # -- whole text is one price
+
+# Fast path: markers matched directly in the raw page bytes, before any parsing
+# One alternation, so a single linear pass classifies every marker by its group name
+_RAW_SCAN_RE = re.compile(
+    rb'<div(?=[^>]*\sdata-entity-type="0")[^>]*\sdata-last-price="(?P<price>[^"]*)"'   # -- the quote, not a ribbon
+    rb'|class="YMlKec fxKbKc"[^>]*>\$?(?P<class_price>[0-9][0-9,]*(?:\.[0-9]+)?)<'
+    rb'|class="JwB6zf[^"]*"[^>]*>(?:<[^>]+>)*(?P<change>[+\-]?[0-9.,]+%)<'
+    rb'|>(?:Mkt|Market) cap<.{0,2000}?class="P6K39c[^"]*"[^>]*>(?P<mcap>[^<]+)<',
+    re.S,
+)
+_RAW_MARKERS = frozenset(("price", "change", "mcap"))   # -- all three seen means no DOM is needed
+
+
+def _to_price(raw) -> float | None:
+    """float(raw), or None when the attribute/match is not a number (e.g. "1.2.3")."""
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def _scan_tree(tree: LexborHTMLParser) -> tuple:
+    """Walk the DOM once, returning (price, change text, market cap) for the known Google classes.
+
+    Any of the three may be None; the selector cascades below fill in what this misses.
+    """
+    attr_price = entity_price = class_price = change_text = mkt_cap = None
+    in_mcap_row = entity_seen = False
+
+    for node in tree.root.traverse(include_text=True):
+        if node.is_text_node:
+            # -- the market-cap label precedes its P6K39c value node in document order
+            if node.text_content.strip() in ("Mkt cap", "Market cap"):
+                in_mcap_row = True
+            continue
+
+        attrs   = node.attributes
+        classes = attrs.get("class") or ""
+
+        # -- the quote's own container (entity type 0) beats index ribbons that also carry a price
+        if node.tag == "div" and not entity_seen and attrs.get("data-entity-type") == "0":
+            entity_seen  = True
+            entity_price = _to_price(attrs.get("data-last-price"))
+        elif node.tag == "div" and attr_price is None and attrs.get("data-last-price"):
+            attr_price = _to_price(attrs["data-last-price"])
+        elif class_price is None and "YMlKec" in classes and "fxKbKc" in classes:
+            m = _NUM_RE.search(node.text().replace(",", ""))
+            value = float(m.group().lstrip("$")) if m else None
+            if value is not None and 1 <= value <= 1000:   # -- same stock-price range as the cascade
+                class_price = value
+
+        if change_text is None and "JwB6zf" in classes:
+            change_text = node.text().strip() or None
+        elif in_mcap_row and mkt_cap is None and "P6K39c" in classes:
+            mkt_cap = node.text().strip() or None
+            in_mcap_row = False
+
+        if entity_price is not None and change_text is not None and mkt_cap is not None:
+            break
+
+    price = entity_price if entity_seen else attr_price
+    return (price if price is not None else class_price), change_text, mkt_cap
+
+
+SESSION: aiohttp.ClientSession | None = None   # -- opened on app startup, shared by every request
+FETCH_RETRIES = 2                      # -- extra attempts on connection errors / timeouts
+FETCH_BACKOFF = 0.2                    # -- seconds, doubled on each retry
+MAX_BATCH = 20                         # -- symbols per /quotes request
+
+CACHE_MAXSIZE = 1024
+CACHE_TTL     = 60                     # -- seconds; quotes older than this are re-fetched
+_quote_cache: "OrderedDict[str, dict]" = OrderedDict()   # -- {result, etag, last_modified, fetched_at}
+_quote_locks: dict[str, list] = {}    # -- key -> [lock, callers holding or waiting on it]
+
+
+def _cache_get(key: str) -> dict | None:
+    """Return the cache entry for a normalised symbol, fresh or stale (stale ones are revalidated)."""
+    entry = _quote_cache.get(key)
+    if entry is not None:
+        _quote_cache.move_to_end(key)
+    return entry
+
+
+def _cache_put(key: str, entry: dict) -> None:
+    """Store a cache entry, evicting the least recently used past CACHE_MAXSIZE."""
+    _quote_cache[key] = entry
+    _quote_cache.move_to_end(key)
+    if len(_quote_cache) > CACHE_MAXSIZE:
+        _quote_cache.popitem(last=False)
+
+
+async def scrape_google_finance(symbol: str) -> dict:
+    """Normalise and validate symbol, then return its (cached) quote."""
+    key = symbol.strip().upper()
+    if not _SYMBOL_RE.match(key):
+        raise ValueError(f"Invalid symbol: {symbol!r}")
+    return await _scrape_cached(key)
+
+
+async def _scrape_cached(key: str) -> dict:
+    """Cached wrapper around _scrape_google_finance (CACHE_TTL-second TTL, LRU-bounded)."""
+    # -- one lock per symbol so concurrent misses share a single fetch; dropped once unused
+    slot = _quote_locks.setdefault(key, [asyncio.Lock(), 0])
+    slot[1] += 1
+    try:
+        async with slot[0]:
+            entry = _cache_get(key)
+            if entry is None or time.monotonic() - entry["fetched_at"] >= CACHE_TTL:
+                entry = await _scrape_google_finance(key, entry)
+                _cache_put(key, entry)
+            return entry["result"]
+    finally:
+        slot[1] -= 1
+        if not slot[1]:
+            del _quote_locks[key]
+
+
+def _scan_raw(html: bytes) -> tuple:
+    """Return (price, change text, market cap) matched straight from the raw HTML bytes."""
+    found = {}
+    for m in _RAW_SCAN_RE.finditer(html):
+        found.setdefault(m.lastgroup, m.group(m.lastgroup))
+        if _RAW_MARKERS <= found.keys():
+            break
+
+    price = None
+    if "price" in found:
+        price = _to_price(found["price"])
+    if price is None and "class_price" in found:
+        value = _to_price(found["class_price"].replace(b",", b""))
+        price = value if value is not None and 1 <= value <= 1000 else None   # -- same stock-price range as the cascade
+    return (
+        price,
+        found["change"].decode() if "change" in found else None,
+        unescape(found["mcap"].decode()).strip() if "mcap" in found else None,   # -- &nbsp; etc., as node.text() does
+    )
+
+
+def _price_rank(element) -> tuple:
+    """Sort key putting the main quote (fxKbKc, inside <main>) before index tickers sharing its class."""
+    in_main = False
+    node = element.parent
+    while node is not None:
+        if node.tag == "main":
+            in_main = True
+            break
+        node = node.parent
+    return ("fxKbKc" not in (element.attributes.get("class") or ""), not in_main)
+
+
+def _extract_price(tree: LexborHTMLParser) -> float | None:
+    """Return the first plausible stock price found by the fallback selectors."""
+    logger.debug("Trying price selectors")
+    for selector, tags in _PRICE_SELECTORS:
+        elements = [el for el in tree.css(selector) if tags is None or el.tag in tags]
+        if selector == ".YMlKec":
+            elements.sort(key=_price_rank)
+        for element in elements:
+            m = _PRICE_TEXT_RE.match(element.text())
+            if not m:
+                continue
+            potential_price = float(m.group(1).replace(",", ""))
+
+            # Skip market index prices (typically over 1000) and focus on stock prices
+            if 1 <= potential_price <= 1000:  # Reasonable US stock price range
+                logger.debug("Using stock price %s from selector %s", potential_price, selector)
+                return potential_price
+
+    logger.debug("No price found with any selector, looking for any number that might be a price")
+    # Try to find any element with a number that looks like a price
+    for node in tree.root.traverse(include_text=True):
+        if not node.is_text_node:
+            continue
+        m = _PRICE_TEXT_RE.match(node.text_content)
+        if not m:
+            continue
+        potential_price = float(m.group(1).replace(",", ""))
+        if 1 < potential_price < 10000:  # Reasonable stock price range
+            logger.debug("Using potential price: %s", potential_price)
+            return potential_price
+
+    return None
+
+
+def _extract_change(tree: LexborHTMLParser) -> str | None:
+    """Return the text of the first change block matched by the fallback selectors."""
+    logger.debug("Trying change selectors")
+    for selector, tags in _CHANGE_SELECTORS:
+        for chg_block in tree.css(selector):
+            if tags is None or chg_block.tag in tags:
+                logger.debug("Found change block with selector: %s", selector)
+                return chg_block.text().strip()
+    return None
+
+
+def _extract_mcap(tree: LexborHTMLParser) -> str | None:
+    """Return the market cap from the first fallback-selector row labelled as such."""
+    logger.debug("Trying market cap selectors")
+    for selector, tags in _MCAP_SELECTORS:
+        for row in tree.css(selector):
+            if tags is not None and row.tag not in tags:
+                continue
+            row_text = row.text()
+            if "Mkt cap" in row_text or "Market cap" in row_text:
+                val = row.css_first("div.P6K39c") or row.css_first("span") or row
+                logger.debug("Market cap value: %s", val.text())
+                return val.text()
+    return None
+
+
+def _parse_html(html: bytes) -> tuple:
+    """Parse the page with Lexbor and return (price, change text, market cap)."""
+    tree = LexborHTMLParser(html)
+
+    # Single pass over the DOM for the current Google Finance markup
+    price, change_text, mkt_cap = _scan_tree(tree)
+    logger.debug("Tree scan found price=%s, change=%r, market cap=%r", price, change_text, mkt_cap)
+
+    # Selector cascades only for what the scan missed; each stops at its first hit
+    if price is None:
+        price = _extract_price(tree)
+    if change_text is None:
+        change_text = _extract_change(tree)
+    if mkt_cap is None:
+        mkt_cap = _extract_mcap(tree)
+
+    return price, change_text, mkt_cap
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared keep-alive session, opening it if startup has not (e.g. when used as a library)."""
+    global SESSION
+    if SESSION is None or SESSION.closed:
+        connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=30)
+        SESSION = aiohttp.ClientSession(headers=HEADERS, connector=connector)
+    return SESSION
+
+
+async def _fetch(url: str, headers: dict | None = None) -> tuple:
+    """GET url over the pooled session, returning (status, headers, body).
+
+    Transient failures are retried with exponential backoff.
+    """
+    for attempt in range(FETCH_RETRIES + 1):
+        try:
+            async with _get_session().get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                logger.debug("Response status: %s", response.status)
+                return response.status, response.headers, await response.read()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if attempt == FETCH_RETRIES:
+                raise
+            logger.debug("Fetch attempt %d for %s failed (%s), retrying", attempt + 1, url, e)
+            await asyncio.sleep(FETCH_BACKOFF * 2 ** attempt)
+
+
+async def _scrape_google_finance(symbol: str, cached: dict | None = None) -> dict:
+    """Return a cache entry holding price, abs change, % change and market-cap scraped from Google Finance.
+
+    Given the previous (stale) entry, the request is made conditional on its ETag/Last-Modified
+    and a 304 reuses its quote without downloading or parsing the page again.
+    """
     url  = f"https://www.google.com/finance/quote/{symbol}?hl=en"
-    print(f"Fetching data from: {url}")
+    logger.debug("Fetching data from: %s", url)
+
+    validators = {}
+    if cached is not None:
+        if cached["etag"]:
+            validators["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            validators["If-Modified-Since"] = cached["last_modified"]
     
     try:
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        print(f"Response status: {response.status_code}")
-        html = response.text
+        status, headers, html = await _fetch(url, validators or None)
     except Exception as e:
-        print(f"Error fetching URL: {e}")
+        logger.warning("Error fetching %s: %s", url, e)
         raise ValueError(f"Failed to fetch data: {e}")
+
+    if status == 304 and cached is not None:
+        logger.debug("%s not modified, reusing cached quote", symbol)
+        return {**cached, "fetched_at": time.monotonic()}
     
-    soup = BeautifulSoup(html, "lxml")
-
-    # Debug: Print the first 2000 characters of HTML to see structure
-    print("HTML preview (first 2000 chars):")
-    print(html[:2000])
-    print("\n" + "="*50 + "\n")
-
-    # First try to get price from data attribute (most reliable)
-    # Look for the main stock container with the symbol data
-    price_container = soup.find('div', {'data-entity-type': '0'}) or soup.find('div', {'data-last-price': True})
-    if price_container:
-        price_data = price_container.get('data-last-price')
-        if price_data:
-            try:
-                price = float(price_data)
-                print(f"✓ Found price from data-last-price attribute: {price}")
-            except (ValueError, TypeError):
-                price = None
-                print(f"✗ Failed to parse data-last-price: {price_data}")
-        else:
-            price = None
-            print("Found container but no data-last-price attribute")
+    # Debug: log the first 2000 characters of HTML to see structure
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("HTML preview (first 2000 chars):\n%s", html[:2000].decode("utf-8", "replace"))
+
+    # Cheap regex pass over the raw bytes; only build a DOM if it comes up short
+    price, change_text, mkt_cap = _scan_raw(html)
+    if price is None or change_text is None or mkt_cap is None:
+        price, change_text, mkt_cap = _parse_html(html)
     else:
-        price = None
-        print("No data-last-price attribute found, trying CSS selectors...")
-        
-    # Fallback to CSS selectors if data attribute method failed
-    price_selectors = [
-        "main div.YMlKec.fxKbKc",  # More specific - look in main content area
-        "div.AHmHk div.YMlKec.fxKbKc",  # Target the main price display area
-        "div.YMlKec.fxKbKc",
-        "main div.YMlKec",  # More specific for main content
-        "div.YMlKec",
-        "span.YMlKec",
-        ".YMlKec",
-        "div[data-last-price]",
-        "span[data-last-price]",
-        "div[data-price]",
-        "span[data-price]",
-        "div[data-value]",
-        "span[data-value]",
-        ".price",
-        "[data-price]",
-        "div[class*='price']",
-        "span[class*='price']",
-        "div[class*='value']",
-        "span[class*='value']",
-        "div[class*='last']",
-        "span[class*='last']",
-        "div[class*='quote']",
-        "span[class*='quote']"
-    ]
-    
-    # Only try CSS selectors if data attribute method failed
-    if price is None:
-        price_tag = None
-        print("Trying price selectors:")
-        
-        # Filter out prices that look like market indices (too high for stock prices)
-        for selector in price_selectors:
-            elements = soup.select(selector)
-            print(f"Found {len(elements)} elements with selector: {selector}")
-            
-            for i, element in enumerate(elements):
-                print(f"  Element {i+1} text: '{element.text}'")
-                try:
-                    # Clean the text and extract number
-                    clean_text = element.text.replace(",", "").replace("$", "").strip()
-                    potential_price = float(clean_text)
-                    
-                    # Skip market index prices (typically over 1000) and focus on stock prices
-                    if 1 <= potential_price <= 1000:  # Reasonable US stock price range
-                        price = potential_price
-                        price_tag = element
-                        print(f"  ✓ Using stock price: {price} (skipping market indices)")
-                        break
-                    else:
-                        print(f"  ✗ Skipping market index price: {potential_price}")
-                        
-                except ValueError as e:
-                    print(f"  ✗ Failed to parse element text: {e}")
-                    continue
-            
-            if price is not None:
-                break
-    
-    if price is None:
-        print("\nNo price found with any method. Looking for any number that might be a price...")
-        # Try to find any element with a number that looks like a price
-        for element in soup.find_all(text=re.compile(r'\$?\d+\.?\d*')):
-            print(f"Found potential price text: {element}")
-            try:
-                clean_text = element.replace(",", "").replace("$", "").strip()
-                potential_price = float(clean_text)
-                if 1 < potential_price < 10000:  # Reasonable stock price range
-                    price = potential_price
-                    print(f"Using potential price: {price}")
-                    break
-            except ValueError:
-                continue
+        logger.debug("Raw scan found price=%s, change=%r, market cap=%r", price, change_text, mkt_cap)
 
-    # Try multiple selectors for change - updated with current Google Finance classes
-    change_selectors = [
-        "div.JwB6zf",  # Current class for change display
-        "span.NydbP",  # Container for change information
-        "div[data-change]",
-        "span[data-change]",
-        ".change",
-        "[data-change]",
-        "div[class*='change']",
-        "span[class*='change']",
-        "div[class*='diff']",
-        "span[class*='diff']"
-    ]
-    
-    print("\nTrying change selectors:")
-    chg_block = None
-    for selector in change_selectors:
-        chg_block = soup.select_one(selector)
-        if chg_block:
-            print(f"✓ Found change block with selector: {selector}")
-            print(f"  Change block text: '{chg_block.text}'")
-            break
-        else:
-            print(f"✗ No match for selector: {selector}")
-    
     abs_chg, pct_chg = (None, None)
-    if chg_block:
-        change_text = chg_block.text.strip()
-        print(f"  Raw change text: '{change_text}'")
-        
+    if change_text:
         # Current Google Finance format is just the percentage like "-0.31%"
         if '%' in change_text:
             pct_chg = change_text
-            print(f"  ✓ Parsed percent change: {pct_chg}")
+            logger.debug("Parsed percent change: %s", pct_chg)
             
             # Calculate absolute change from percentage and current price
             if price:
@@ -167,49 +363,18 @@ def scrape_google_finance(symbol: str) -> dict:
                     pct_val = float(pct_chg.replace('%', '').replace('+', ''))
                     abs_val = price * (pct_val / 100)
                     abs_chg = f"{abs_val:+.2f}"
-                    print(f"  ✓ Calculated absolute change: {abs_chg}")
+                    logger.debug("Calculated absolute change: %s", abs_chg)
                 except (ValueError, TypeError):
                     pass
         else:
             # Fallback: try traditional format like "+1.50 (+0.74%)"  
-            full_match = re.search(r"([+\-]?[0-9.,]+)\s*\(([+\-]?[0-9.,%]+)\)", change_text)
+            full_match = _CHANGE_RE.search(change_text)
             if full_match:
                 abs_chg, pct_chg = full_match.groups()
-                print(f"  ✓ Parsed absolute change: {abs_chg}")
-                print(f"  ✓ Parsed percent change: {pct_chg}")
-
-    # Try multiple selectors for market cap - updated patterns
-    market_cap_selectors = [
-        "div.P6K39c",   # Value container class seen in HTML
-        "div.KFglDc",   # Legacy class
-        "div[data-market-cap]",
-        "span[data-market-cap]",
-        ".market-cap",
-        "[data-market-cap]",
-        "div[class*='cap']",
-        "span[class*='cap']",
-        "div[class*='P6K39c']",  # Current value display class
-        "span[class*='P6K39c']"
-    ]
-    
-    print("\nTrying market cap selectors:")
-    mkt_cap = None
-    for selector in market_cap_selectors:
-        rows = soup.select(selector)
-        print(f"Found {len(rows)} elements with selector: {selector}")
-        for i, row in enumerate(rows):
-            print(f"  Row {i+1} text: '{row.text}'")
-            if "Mkt cap" in row.text or "Market cap" in row.text:
-                val = row.select_one("div.P6K39c") or row.select_one("span") or row
-                mkt_cap = val.text if val else None
-                print(f"  ✓ Market cap value: {mkt_cap}")
-                break
-        if mkt_cap:
-            break
+                logger.debug("Parsed absolute change: %s, percent change: %s", abs_chg, pct_chg)
 
     if price is None:
-        print("\nERROR: Could not find price with any selector")
-        print("This suggests Google Finance has completely changed their HTML structure")
+        logger.warning("Could not find price for %s with any selector - Google Finance markup may have changed", symbol)
         raise ValueError("Unable to parse quote — Google changed its markup?")
 
     result = {
@@ -220,28 +385,60 @@ def scrape_google_finance(symbol: str) -> dict:
         "market_cap":  mkt_cap,
     }
     
-    print(f"\nFinal result: {result}")
-    return result
+    logger.debug("Final result: %s", result)
+    return {
+        "result":        result,
+        "etag":          headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "fetched_at":    time.monotonic(),
+    }
 
 
 app = FastAPI(title="Stock Price Scraper", description="Scrape stock prices from Google Finance")
 
+@app.on_event("startup")
+async def open_session():
+    """Open the shared HTTP session (pooled keep-alive connections, cached DNS)."""
+    _get_session()
+
+@app.on_event("shutdown")
+async def close_session():
+    """Close the shared HTTP session."""
+    if SESSION is not None:
+        await SESSION.close()
+
 @app.get("/quote")
-def get_quote(symbol: str = "AAPL"):
+async def get_quote(symbol: str = "AAPL"):
     """Get stock quote for a given symbol."""
     try:
-        return scrape_google_finance(symbol)
+        return await scrape_google_finance(symbol)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching quote: {str(e)}")
 
+@app.get("/quotes")
+async def get_quotes(symbols: str = "AAPL,GOOGL,MSFT"):
+    """Get stock quotes for a comma-separated list of symbols, fetched concurrently."""
+    syms = [s.strip().upper() for s in symbols.split(",") if s.strip()]   # -- errors reported under the same key as quotes
+    if not syms:
+        raise HTTPException(status_code=400, detail="No symbols given")
+    if len(syms) > MAX_BATCH:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH} symbols per request")
+
+    results = await asyncio.gather(*(scrape_google_finance(s) for s in syms), return_exceptions=True)
+    # -- one failing symbol reports its error in place instead of failing the whole batch
+    return [
+        {"symbol": sym, "error": str(res)} if isinstance(res, Exception) else res
+        for sym, res in zip(syms, results)
+    ]
+
 @app.get("/")
 def root():
     """Root endpoint with usage instructions."""
     return {
         "message": "Stock Price Scraper API",
-        "usage": "GET /quote?symbol=AAPL to get stock quote",
+        "usage": "GET /quote?symbol=AAPL to get stock quote, GET /quotes?symbols=AAPL,MSFT for several",
         "example": "/quote?symbol=GOOGL"
     }
 